@@ -2,18 +2,21 @@ from flask import Flask, render_template_string, request, send_file, redirect, u
 import threading
 import os
 import main as scraper_main
+from scraper import output
 
 app = Flask(__name__)
 
-job_status = {'running': False, 'done': False, 'message': '', 'output_csv': '', 'output_json': ''}
+job_status = {'running': False, 'done': False, 'message': '', 'output_csv': '', 'output_json': '', 'output_parquet': ''}
 
-def run_scraper(urls, dynamic, paginate, delay, proxies, config):
+def run_scraper(urls, dynamic, paginate, delay, proxies, config, parquet=False):
     job_status['running'] = True
     job_status['done'] = False
     job_status['message'] = 'Scraping in progress...'
     try:
         args = ["--urls"] + urls
-        if dynamic:
+        if dynamic == 'auto':
+            args += ["--dynamic", "auto"]
+        elif dynamic:
             args.append("--dynamic")
         if paginate:
             args.append("--paginate")
@@ -23,12 +26,15 @@ def run_scraper(urls, dynamic, paginate, delay, proxies, config):
             args += ["--proxies", proxies]
         if config:
             args += ["--config", config]
+        if parquet:
+            args.append("--parquet")
         import sys
         sys.argv = ["main.py"] + args
         scraper_main.main()
         job_status['message'] = 'Scraping complete.'
         job_status['output_csv'] = 'output.csv'
         job_status['output_json'] = 'output.json'
+        job_status['output_parquet'] = 'output.parquet' if parquet and os.path.exists('output.parquet') else ''
     except Exception as e:
         job_status['message'] = f'Error: {e}'
     finally:
@@ -39,13 +45,15 @@ def run_scraper(urls, dynamic, paginate, delay, proxies, config):
 def index():
     if request.method == 'POST':
         urls = request.form['urls'].split()
-        dynamic = 'dynamic' in request.form
+        dynamic = request.form.get('dynamic', 'off')
+        dynamic = 'auto' if dynamic == 'auto' else dynamic == 'always'
         paginate = 'paginate' in request.form
         delay_min = float(request.form.get('delay_min', 1))
         delay_max = float(request.form.get('delay_max', 3))
         proxies = request.form.get('proxies_file') or None
         config = request.form.get('config_file') or None
-        t = threading.Thread(target=run_scraper, args=(urls, dynamic, paginate, [delay_min, delay_max], proxies, config))
+        parquet = 'parquet' in request.form
+        t = threading.Thread(target=run_scraper, args=(urls, dynamic, paginate, [delay_min, delay_max], proxies, config, parquet))
         t.start()
         return redirect(url_for('status'))
     return render_template_string('''
@@ -73,14 +81,24 @@ def index():
                     <label class="form-label">URLs (space-separated)</label>
                     <input name="urls" class="form-control" placeholder="https://example.com https://another.com" required>
                 </div>
-                <div class="mb-3 form-check form-switch">
-                    <input class="form-check-input" type="checkbox" name="dynamic" id="dynamic">
-                    <label class="form-check-label" for="dynamic">Dynamic Content (Selenium)</label>
+                <div class="mb-3">
+                    <label class="form-label" for="dynamic">Dynamic Content (Selenium)</label>
+                    <select class="form-select" name="dynamic" id="dynamic">
+                        <option value="off">Off (static only)</option>
+                        <option value="auto">Auto (browser only for JavaScript-rendered pages)</option>
+                        <option value="always">Always</option>
+                    </select>
                 </div>
                 <div class="mb-3 form-check form-switch">
                     <input class="form-check-input" type="checkbox" name="paginate" id="paginate">
                     <label class="form-check-label" for="paginate">Pagination</label>
                 </div>
+                {% if parquet_available %}
+                <div class="mb-3 form-check form-switch">
+                    <input class="form-check-input" type="checkbox" name="parquet" id="parquet">
+                    <label class="form-check-label" for="parquet">Parquet Export</label>
+                </div>
+                {% endif %}
                 <div class="row mb-3">
                     <div class="col">
                         <label class="form-label">Delay Min (s)</label>
@@ -108,7 +126,7 @@ def index():
     </div>
     </body>
     </html>
-    ''')
+    ''', parquet_available=output.parquet_available())
 
 @app.route('/status')
 def status():
@@ -132,6 +150,9 @@ def status():
                 <div class="d-flex justify-content-center gap-3">
                     <a href="/download/csv" class="btn btn-success">Download CSV</a>
                     <a href="/download/json" class="btn btn-secondary">Download JSON</a>
+                    {% if parquet %}
+                    <a href="/download/parquet" class="btn btn-secondary">Download Parquet</a>
+                    {% endif %}
                     <a href="/" class="btn btn-link">Back</a>
                 </div>
             {% else %}
@@ -147,7 +168,7 @@ def status():
     </div>
     </body>
     </html>
-    ''', msg=job_status['message'], done=job_status['done'])
+    ''', msg=job_status['message'], done=job_status['done'], parquet=job_status['output_parquet'])
 
 @app.route('/download/csv')
 def download_csv():
@@ -161,5 +182,11 @@ def download_json():
         return send_file('output.json', as_attachment=True)
     return 'No JSON output found.'
 
+@app.route('/download/parquet')
+def download_parquet():
+    if os.path.exists('output.parquet'):
+        return send_file('output.parquet', as_attachment=True)
+    return 'No Parquet output found.'
+
 if __name__ == '__main__':
     app.run(debug=True) 
\ No newline at end of file
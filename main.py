@@ -2,15 +2,15 @@
 main.py
 Entry point for the web scraper. Orchestrates input, extraction, and output.
 """
-from scraper import input, extract, output, errors, utils, crawler
+from scraper import input, extract, output, errors, utils, crawler, dedup, retry, records
 
 def main():
     """
     Main function to run the web scraper:
     1. Parse user input (search query or URLs)
-    2. Validate and check reachability of URLs
+    2. Validate, canonicalize and check reachability of URLs
     3. Fetch and extract company info
-    4. Output results to CSV/JSON
+    4. Merge records per company and output results to CSV/JSON (and Parquet)
     5. Handle and log errors
     """
     try:
@@ -21,10 +21,19 @@ def main():
         delay = args['delay']
         proxies = utils.get_proxies(args['proxies']) if args['proxies'] else None
         config = utils.load_config(args['config']) if args['config'] else None
+        http_config = dict(config or {})
+        if args['timeout'] is not None:
+            http_config['timeout'] = args['timeout']
+        if args['retries'] is not None:
+            http_config['max_retries'] = args['retries']
+        retry.configure(http_config)
+        if args['fields']:
+            config = dict(config or {}, fields=args['fields'])
+        fields = records.resolve_fields((config or {}).get('fields'))
         if isinstance(user_input, str):
             utils.log_error("Search query input is not yet supported. Please provide URLs with --urls.")
             return
-        urls = input.validate_urls(user_input)
+        urls = dedup.dedupe_urls(input.validate_urls(user_input))
         reachable_urls = input.check_reachability(urls)
         if not reachable_urls:
             utils.log_error("No reachable URLs provided.")
@@ -34,21 +43,27 @@ def main():
         if paginate:
             for url in reachable_urls:
                 all_urls.extend(crawler.crawl_pagination(url))
-            # Remove duplicates
-            all_urls = list(dict.fromkeys(all_urls))
+            # Remove pages already seen under another URL form
+            all_urls = dedup.dedupe_urls(all_urls)
         else:
             all_urls = reachable_urls
         results = extract.process_urls(all_urls, dynamic=dynamic, delay=delay, proxies=proxies, config=config)
         if not results:
             utils.log_error("No company information could be extracted from the provided URLs.")
             return
-        output.write_csv(results, "output.csv")
-        output.write_json(results, "output.json")
+        results = dedup.merge_records(results)
+        output.write_csv(results, "output.csv", fields)
+        output.write_json(results, "output.json", fields)
+        if args['parquet']:
+            if output.parquet_available():
+                output.write_parquet(results, "output.parquet", fields)
+            else:
+                utils.log_error("Parquet export requested but pyarrow is not installed; skipping output.parquet.")
         print(f"Extraction complete. {len(results)} records saved to output.csv and output.json.")
     except errors.InvalidURLError as e:
         utils.log_error(f"Invalid URL: {e}")
-    except errors.URLUnreachableError as e:
-        utils.log_error(f"Unreachable URL: {e}")
+    except errors.InvalidFieldError as e:
+        utils.log_error(f"Invalid field selection: {e}")
     except Exception as e:
         utils.log_error(f"Unexpected error: {e}")
 
@@ -2,11 +2,12 @@
 crawler.py
 Handles pagination and URL discovery for web scraping.
 """
-import requests
 from bs4 import BeautifulSoup
 import re
 from urllib.parse import urljoin
 from scraper.errors import NetworkError
+from scraper.dedup import canonicalize_url
+from scraper import retry
 
 def crawl_pagination(start_url: str, max_pages: int = 10) -> list:
     """
@@ -18,10 +19,11 @@ def crawl_pagination(start_url: str, max_pages: int = 10) -> list:
         list: List of discovered paginated URLs (including start_url).
     """
     urls = [start_url]
+    seen = {canonicalize_url(start_url)}
     current_url = start_url
     for _ in range(max_pages - 1):
         try:
-            resp = requests.get(current_url, timeout=10)
+            resp = retry.get(current_url)
             resp.raise_for_status()
             soup = BeautifulSoup(resp.text, 'html.parser')
             # Look for 'next' link (common patterns)
@@ -30,8 +32,10 @@ def crawl_pagination(start_url: str, max_pages: int = 10) -> list:
             if not next_link or not next_link.get('href'):
                 break
             next_url = urljoin(current_url, next_link['href'])
-            if next_url in urls:
+            next_key = canonicalize_url(next_url)
+            if next_key in seen:
                 break
+            seen.add(next_key)
             urls.append(next_url)
             current_url = next_url
         except Exception:
@@ -0,0 +1,136 @@
+"""
+dedup.py
+URL canonicalization, a canonical URL/domain index, and record-level merging.
+"""
+from typing import List, Dict, Optional
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from scraper import utils
+from scraper.records import CompanyRecord
+
+# Query parameters that only track the visitor and never change page content
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid',
+    'yclid', '_ga', '_gl', 'ref_src',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Return the canonical key for a URL. Two URLs with the same key serve the
+    same page: scheme, host case, 'www.' prefix, default ports, trailing
+    slashes, fragments, tracking parameters and query parameter order are
+    all ignored. The key is only used for de-duplication, never for fetching.
+    Args:
+        url (str): The URL to canonicalize.
+    Returns:
+        str: Canonical key such as 'example.com/about?id=1'.
+    """
+    url = url.strip()
+    if '://' not in url:
+        url = 'http://' + url
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    if ':' in host:
+        host = f"[{host}]"  # IPv6 literal
+    if host.startswith('www.'):
+        host = host[4:]
+    port = parts.port
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    path = parts.path.rstrip('/')
+    query = urlencode(sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                             if not _is_tracking_param(k)))
+    key = host + path
+    return f"{key}?{query}" if query else key
+
+
+class URLIndex:
+    """
+    Index of URLs keyed by canonical URL and by registered domain.
+    Keeps the first URL seen for each canonical key, unchanged, in insertion order.
+    """
+
+    def __init__(self, urls: Optional[List[str]] = None):
+        self.by_canonical: Dict[str, str] = {}
+        self.by_domain: Dict[str, List[str]] = {}
+        for url in urls or []:
+            self.add(url)
+
+    def add(self, url: str) -> bool:
+        """
+        Add a URL to the index.
+        Returns:
+            bool: True if the URL was new, False if it duplicates an indexed URL.
+        """
+        key = canonicalize_url(url)
+        if key in self.by_canonical:
+            return False
+        self.by_canonical[key] = url.strip()
+        domain = utils.get_registered_domain(url) or key.split('/', 1)[0]
+        self.by_domain.setdefault(domain, []).append(key)
+        return True
+
+    def __contains__(self, url: str) -> bool:
+        return canonicalize_url(url) in self.by_canonical
+
+    def __len__(self) -> int:
+        return len(self.by_canonical)
+
+    def urls(self) -> List[str]:
+        """Return the unique URLs in the order they were first added."""
+        return list(self.by_canonical.values())
+
+
+def dedupe_urls(urls: List[str]) -> List[str]:
+    """
+    Remove URLs that canonicalize to an already seen page.
+    Args:
+        urls (List[str]): URLs to de-duplicate.
+    Returns:
+        List[str]: The first URL seen for each page, in their original order.
+    """
+    return URLIndex(urls).urls()
+
+
+def _page_depth(key: str) -> int:
+    """Return how deep a canonical key sits below its site root (root = 0)."""
+    path, _, query = key.partition('?')
+    return path.count('/') + (1 if query else 0)
+
+
+def merge_records(records: List[CompanyRecord]) -> List[CompanyRecord]:
+    """
+    Merge records that belong to the same company, i.e. whose 'website'
+    shares a registered domain in a URLIndex of all record websites.
+    Within a company the pages are ranked root page first, then by depth
+    below the root (ties keep their original order), and each field takes
+    the first non-empty value in that ranking. The home page is the most
+    authoritative source for company-level fields; deeper pages only fill
+    in what it lacks.
+    Args:
+        records (List[CompanyRecord]): Extracted company records.
+    Returns:
+        List[CompanyRecord]: One record per company, in first-seen order.
+    """
+    index = URLIndex()
+    by_key: Dict[str, List[CompanyRecord]] = {}
+    for record in records:
+        website = record.get('website', '')
+        index.add(website)
+        by_key.setdefault(canonicalize_url(website), []).append(record)
+    merged = []
+    for keys in index.by_domain.values():
+        ranked = [record for key in sorted(keys, key=_page_depth) for record in by_key[key]]
+        target = ranked[0].copy()
+        for record in ranked[1:]:
+            for field, value in record.items():
+                if value and not target.get(field):
+                    target[field] = value
+        merged.append(target)
+    return merged
@@ -1,13 +1,48 @@
 """
 dynamic.py
 Fetches HTML content from JavaScript-rendered pages using Selenium.
+Selenium and webdriver_manager are imported on first use so that static-only
+runs never pay for them.
 """
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import re
 import time
 
+# Mount points used by common client-side frameworks (React, Vue, Next, Nuxt, Angular)
+SPA_ROOT_RE = re.compile(
+    r'<div[^>]*\bid=["\']?(?:root|app|__next|__nuxt|svelte)(?=["\'\s>])[^>]*>\s*</div>'
+    r'|<app-root[^>]*>\s*</app-root>',
+    re.IGNORECASE)
+NOSCRIPT_JS_RE = re.compile(r'<noscript[^>]*>[^<]*enable javascript', re.IGNORECASE)
+SCRIPT_STYLE_RE = re.compile(r'<(script|style|noscript|template)\b[^>]*>.*?</\1>', re.IGNORECASE | re.DOTALL)
+BODY_RE = re.compile(r'<body\b[^>]*>(.*)</body>', re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Pages with less visible body text than this are treated as empty shells
+MIN_BODY_TEXT = 50
+# An empty mount point or a "please enable JavaScript" notice only counts on
+# pages with little visible text; server-rendered pages often have both
+MAX_SHELL_TEXT = 500
+
+
+def looks_client_rendered(html: str) -> bool:
+    """
+    Heuristically decide whether statically fetched HTML is a client-rendered
+    shell that needs a browser: almost no visible body text, or little text
+    together with an empty SPA mount point or a "please enable JavaScript" notice.
+    Args:
+        html (str): HTML content fetched without JavaScript.
+    Returns:
+        bool: True if the page should be rendered with Selenium.
+    """
+    match = BODY_RE.search(html)
+    body = match.group(1) if match else html
+    text_len = len(' '.join(TAG_RE.sub(' ', SCRIPT_STYLE_RE.sub(' ', body)).split()))
+    if text_len < MIN_BODY_TEXT:
+        return True
+    if text_len >= MAX_SHELL_TEXT:
+        return False
+    return bool(SPA_ROOT_RE.search(html) or NOSCRIPT_JS_RE.search(html))
+
 def fetch_dynamic_page(url: str, wait: int = 3) -> str:
     """
     Fetch the fully rendered HTML of a page using Selenium.
@@ -17,6 +52,10 @@ def fetch_dynamic_page(url: str, wait: int = 3) -> str:
     Returns:
         str: Rendered HTML content.
     """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
     options = Options()
     options.add_argument('--headless')
     options.add_argument('--disable-gpu')
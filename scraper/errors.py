@@ -15,6 +15,14 @@ class NetworkError(Exception):
     """Raised when a network error occurs during fetching."""
     pass
 
+class CircuitOpenError(NetworkError):
+    """Raised when a host's circuit breaker is open and requests fail fast."""
+    pass
+
 class DataExtractionError(Exception):
     """Raised when required data cannot be extracted from a page."""
     pass
+
+class InvalidFieldError(Exception):
+    """Raised when an unknown output field is requested."""
+    pass
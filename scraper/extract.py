@@ -2,21 +2,20 @@
 extract.py
 Handles fetching web pages and extracting company information.
 """
-from typing import List, Dict
+from typing import Dict, List, Union
+from urllib.parse import urlsplit
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 from scraper.errors import NetworkError, DataExtractionError
-import tldextract
+from scraper import retry
 import os
-from dotenv import load_dotenv
-from scraper.dynamic import fetch_dynamic_page
+from scraper.dynamic import fetch_dynamic_page, looks_client_rendered
 from scraper import utils
+from scraper.records import CompanyRecord, HUNTER_FIELDS, resolve_fields
 import time
 from tqdm import tqdm
 
-load_dotenv()  # For demo only; use env var in production
-
 SOCIAL_PLATFORMS = [
     ("linkedin", "linkedin.com"),
     ("twitter", "twitter.com"),
@@ -31,6 +30,18 @@ TECH_KEYWORDS = [
     'docker', 'kubernetes', 'mysql', 'postgresql', 'mongodb', 'redis', 'graphql', 'typescript', 'javascript', 'python', 'java', 'php', 'c#', 'c++', 'go', 'swift', 'kotlin'
 ]
 
+# Fields that only need <title>, <meta>, <a> and <address> tags (or regexes
+# over the raw HTML), so the parse can skip building the rest of the tree
+LIGHT_FIELDS = frozenset({
+    'company_name', 'website', 'email', 'phone', 'linkedin', 'twitter', 'facebook',
+    'instagram', 'address', 'description', 'year_founded',
+}) | frozenset(HUNTER_FIELDS)
+LIGHT_TAGS = ['title', 'meta', 'a', 'address']
+SELECTOR_KEYS = ('company_name_selector', 'email_selector', 'phone_selector')
+# Fields a client-rendered shell can fill without any rendered body content:
+# <head> metadata, and tech keywords matched in its script tags
+SHELL_FIELDS = frozenset({'website', 'company_name', 'description', 'tech_stack'})
+
 US_STATE_ABBR = {
     'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas', 'CA': 'California',
     'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware', 'FL': 'Florida', 'GA': 'Georgia',
@@ -61,9 +72,11 @@ def fetch_page(url: str, dynamic: bool = False, proxy: str = None) -> str:
         if dynamic:
             return fetch_dynamic_page(url)
         proxies = {"http": proxy, "https": proxy} if proxy else None
-        resp = requests.get(url, timeout=10, proxies=proxies)
+        resp = retry.get(url, proxies=proxies)
         resp.raise_for_status()
         return resp.text
+    except NetworkError:
+        raise
     except requests.RequestException as e:
         raise NetworkError(f"Failed to fetch {url}: {e}")
     except Exception as e:
@@ -78,12 +91,13 @@ def enrich_with_hunter(domain: str) -> dict:
     Returns:
         dict: Enriched data (company, industry, emails, etc.)
     """
+    utils.load_env()
     api_key = os.environ.get("HUNTER_API_KEY", "")
     if not api_key:
         return {}
     url = f"https://api.hunter.io/v2/domain-search?domain={domain}&api_key={api_key}"
     try:
-        resp = requests.get(url, timeout=10)
+        resp = retry.get(url)
         if resp.status_code == 200:
             data = resp.json().get('data', {})
             state = data.get('state', '')
@@ -105,178 +119,277 @@ def enrich_with_hunter(domain: str) -> dict:
         return {}
 
 
-def extract_company_info(html: str, url: str, config: dict = None) -> Dict[str, str]:
+def extract_company_info(html: str, url: str, config: dict = None) -> CompanyRecord:
+    """
+    Extract company information from a page.
+    Only the fields selected by config['fields'] are computed; the scans and
+    network calls behind unselected fields are skipped.
+    Args:
+        html (str): Page HTML.
+        url (str): Page URL.
+        config (dict): Custom selectors/regex and optional 'fields' selection.
+    Returns:
+        CompanyRecord: The extracted record; unselected fields are empty.
+    Raises:
+        DataExtractionError: If none of the selected name/email/phone fields are
+            found, or, when none of those are selected, if no selected field
+            (page or Hunter.io) has a value.
+    """
     config = config or {}
-    soup = BeautifulSoup(html, 'html.parser')
+    wanted = resolve_fields(config.get('fields'))
+    if wanted <= LIGHT_FIELDS and not any(config.get(key) for key in SELECTOR_KEYS):
+        soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer(LIGHT_TAGS))
+    else:
+        soup = BeautifulSoup(html, 'html.parser')
+    fields = {'website': url}
     # Company name
-    name = None
-    name_selector = config.get('company_name_selector')
-    if name_selector:
-        el = soup.select_one(name_selector)
-        if el:
-            name = el.get_text(strip=True)
-    if not name:
-        if soup.title and soup.title.string:
-            name = soup.title.string.strip()
-    if not name:
-        og_site_name = soup.find('meta', property='og:site_name')
-        if og_site_name and og_site_name.get('content'):
-            name = og_site_name['content'].strip()
-    website = url
+    if 'company_name' in wanted:
+        name = None
+        name_selector = config.get('company_name_selector')
+        if name_selector:
+            el = soup.select_one(name_selector)
+            if el:
+                name = el.get_text(strip=True)
+        if not name:
+            if soup.title and soup.title.string:
+                name = soup.title.string.strip()
+        if not name:
+            og_site_name = soup.find('meta', property='og:site_name')
+            if og_site_name and og_site_name.get('content'):
+                name = og_site_name['content'].strip()
+        fields['company_name'] = name or ''
     # Email
-    email = None
-    email_selector = config.get('email_selector')
-    if email_selector:
-        el = soup.select_one(email_selector)
-        if el:
-            email = el.get_text(strip=True)
-    if not email:
-        mailtos = soup.select('a[href^=mailto]')
-        if mailtos:
-            email = mailtos[0]['href'].replace('mailto:', '').split('?')[0]
-    if not email:
-        email_regex = config.get('email_regex', r'[\w\.-]+@[\w\.-]+')
-        match = re.search(email_regex, html)
-        if match:
-            email = match.group(0)
+    if 'email' in wanted:
+        email = None
+        email_selector = config.get('email_selector')
+        if email_selector:
+            el = soup.select_one(email_selector)
+            if el:
+                email = el.get_text(strip=True)
+        if not email:
+            mailtos = soup.select('a[href^=mailto]')
+            if mailtos:
+                email = mailtos[0]['href'].replace('mailto:', '').split('?')[0]
+        if not email:
+            email_regex = config.get('email_regex', r'[\w\.-]+@[\w\.-]+')
+            match = re.search(email_regex, html)
+            if match:
+                email = match.group(0)
+        fields['email'] = email or ''
     # Phone
-    phone = None
-    phone_selector = config.get('phone_selector')
-    if phone_selector:
-        el = soup.select_one(phone_selector)
-        if el:
-            phone = el.get_text(strip=True)
-    if not phone:
-        tels = soup.select('a[href^=tel]')
-        if tels:
-            phone = tels[0]['href'].replace('tel:', '').split('?')[0]
-    if not phone:
-        phone_regex = config.get('phone_regex', r'\+?\d[\d\s\-()]{7,}\d')
-        match = re.search(phone_regex, html)
-        if match:
-            phone = match.group(0)
+    if 'phone' in wanted:
+        phone = None
+        phone_selector = config.get('phone_selector')
+        if phone_selector:
+            el = soup.select_one(phone_selector)
+            if el:
+                phone = el.get_text(strip=True)
+        if not phone:
+            tels = soup.select('a[href^=tel]')
+            if tels:
+                phone = tels[0]['href'].replace('tel:', '').split('?')[0]
+        if not phone:
+            phone_regex = config.get('phone_regex', r'\+?\d[\d\s\-()]{7,}\d')
+            match = re.search(phone_regex, html)
+            if match:
+                phone = match.group(0)
+        fields['phone'] = phone or ''
+    contact_fields = wanted & {'company_name', 'email', 'phone'}
+    if contact_fields and not any(fields[f] for f in contact_fields):
+        raise DataExtractionError("No company info found on page.")
     # Social media profiles
-    social = {}
     for plat, domain in SOCIAL_PLATFORMS:
-        link = soup.find('a', href=re.compile(domain))
-        social[plat] = link['href'] if link else ''
+        if plat in wanted:
+            link = soup.find('a', href=re.compile(domain))
+            fields[plat] = link['href'] if link else ''
     # Address/location
-    address = ''
-    addr_tag = soup.find('address')
-    if addr_tag:
-        address = addr_tag.get_text(separator=' ', strip=True)
-    else:
-        match = re.search(r'\d{1,5} [\w .,-]+,? [A-Za-z ]+,? [A-Z]{2,} \d{5}', html)
-        if match:
-            address = match.group(0)
+    if 'address' in wanted:
+        address = ''
+        addr_tag = soup.find('address')
+        if addr_tag:
+            address = addr_tag.get_text(separator=' ', strip=True)
+        else:
+            match = re.search(r'\d{1,5} [\w .,-]+,? [A-Za-z ]+,? [A-Z]{2,} \d{5}', html)
+            if match:
+                address = match.group(0)
+        fields['address'] = address
     # Description/tagline
-    description = ''
-    meta_desc = soup.find('meta', attrs={'name': 'description'})
-    if meta_desc and meta_desc.get('content'):
-        description = meta_desc['content'].strip()
-    if not description:
-        og_desc = soup.find('meta', property='og:description')
-        if og_desc and og_desc.get('content'):
-            description = og_desc['content'].strip()
+    if 'description' in wanted:
+        description = ''
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        if meta_desc and meta_desc.get('content'):
+            description = meta_desc['content'].strip()
+        if not description:
+            og_desc = soup.find('meta', property='og:description')
+            if og_desc and og_desc.get('content'):
+                description = og_desc['content'].strip()
+        fields['description'] = description
     # Year founded
-    year_founded = ''
-    match = re.search(r'Founded in (\d{4})', html, re.IGNORECASE)
-    if match:
-        year_founded = match.group(1)
+    if 'year_founded' in wanted:
+        match = re.search(r'Founded in (\d{4})', html, re.IGNORECASE)
+        fields['year_founded'] = match.group(1) if match else ''
     # Products/services (best effort: look for keywords)
-    products = ''
-    services = ''
-    for section in soup.find_all(['section', 'div', 'p']):
-        text = section.get_text(separator=' ', strip=True)
-        if not products and re.search(r'products?|solutions?', text, re.IGNORECASE):
-            products = text[:200]
-        if not services and re.search(r'services?|offerings?', text, re.IGNORECASE):
-            services = text[:200]
-        if products and services:
-            break
+    if wanted & {'products', 'services'}:
+        products = ''
+        services = ''
+        for section in soup.find_all(['section', 'div', 'p']):
+            text = section.get_text(separator=' ', strip=True)
+            if not products and re.search(r'products?|solutions?', text, re.IGNORECASE):
+                products = text[:200]
+            if not services and re.search(r'services?|offerings?', text, re.IGNORECASE):
+                services = text[:200]
+            if products and services:
+                break
+        fields['products'] = products
+        fields['services'] = services
     # Industry/sector (look for keywords)
-    industry = ''
-    for tag in soup.find_all(['p', 'span', 'div']):
-        text = tag.get_text(separator=' ', strip=True)
-        if re.search(r'industry|sector|market', text, re.IGNORECASE):
-            industry = text[:200]
-            break
+    if 'industry' in wanted:
+        industry = ''
+        for tag in soup.find_all(['p', 'span', 'div']):
+            text = tag.get_text(separator=' ', strip=True)
+            if re.search(r'industry|sector|market', text, re.IGNORECASE):
+                industry = text[:200]
+                break
+        fields['industry'] = industry
     # --- Level 3 fields ---
     # Tech stack: look for keywords in HTML and script/link tags
-    tech_stack = set()
-    lower_html = html.lower()
-    for tech in TECH_KEYWORDS:
-        if tech in lower_html:
-            tech_stack.add(tech)
-    # Also check script/link tags for tech hints
-    for tag in soup.find_all(['script', 'link']):
-        src = tag.get('src') or tag.get('href') or ''
+    if 'tech_stack' in wanted:
+        tech_stack = set()
+        lower_html = html.lower()
         for tech in TECH_KEYWORDS:
-            if tech in (src.lower()):
+            if tech in lower_html:
                 tech_stack.add(tech)
-    tech_stack_str = ', '.join(sorted(tech_stack))
+        # Also check script/link tags for tech hints
+        for tag in soup.find_all(['script', 'link']):
+            src = tag.get('src') or tag.get('href') or ''
+            for tech in TECH_KEYWORDS:
+                if tech in (src.lower()):
+                    tech_stack.add(tech)
+        fields['tech_stack'] = ', '.join(sorted(tech_stack))
     # Current projects/focus areas: look for keywords
-    projects = ''
-    for section in soup.find_all(['section', 'div', 'p']):
-        text = section.get_text(separator=' ', strip=True)
-        if re.search(r'project|initiative|focus|case study', text, re.IGNORECASE):
-            projects = text[:200]
-            break
+    if 'projects' in wanted:
+        projects = ''
+        for section in soup.find_all(['section', 'div', 'p']):
+            text = section.get_text(separator=' ', strip=True)
+            if re.search(r'project|initiative|focus|case study', text, re.IGNORECASE):
+                projects = text[:200]
+                break
+        fields['projects'] = projects
     # Competitors: look for sections with 'competitor', 'alternatives', 'vs', or company names
-    competitors = ''
-    for section in soup.find_all(['section', 'div', 'ul', 'ol']):
-        text = section.get_text(separator=' ', strip=True)
-        if re.search(r'competitor|alternative|vs\.?|compared to', text, re.IGNORECASE):
-            competitors = text[:200]
-            break
+    if 'competitors' in wanted:
+        competitors = ''
+        for section in soup.find_all(['section', 'div', 'ul', 'ol']):
+            text = section.get_text(separator=' ', strip=True)
+            if re.search(r'competitor|alternative|vs\.?|compared to', text, re.IGNORECASE):
+                competitors = text[:200]
+                break
+        fields['competitors'] = competitors
     # Market positioning: look for keywords
-    market_position = ''
-    for tag in soup.find_all(['p', 'span', 'div']):
-        text = tag.get_text(separator=' ', strip=True)
-        if re.search(r'leader|challenger|innovator|market position', text, re.IGNORECASE):
-            market_position = text[:200]
-            break
-    if not name and not email and not phone:
-        raise DataExtractionError("No company info found on page.")
-    # Extract domain from website URL
-    ext = tldextract.extract(website)
-    domain = f"{ext.domain}.{ext.suffix}" if ext.domain and ext.suffix else ''
-    hunter_data = enrich_with_hunter(domain) if domain else {}
-    result = {
-        'company_name': name or '',
-        'website': website,
-        'email': email or '',
-        'phone': phone or '',
-        'linkedin': social['linkedin'],
-        'twitter': social['twitter'],
-        'facebook': social['facebook'],
-        'instagram': social['instagram'],
-        'address': address,
-        'description': description,
-        'year_founded': year_founded,
-        'products': products,
-        'services': services,
-        'industry': industry,
-        'tech_stack': tech_stack_str,
-        'projects': projects,
-        'competitors': competitors,
-        'market_position': market_position
-    }
-    result.update(hunter_data)
-    return result
+    if 'market_position' in wanted:
+        market_position = ''
+        for tag in soup.find_all(['p', 'span', 'div']):
+            text = tag.get_text(separator=' ', strip=True)
+            if re.search(r'leader|challenger|innovator|market position', text, re.IGNORECASE):
+                market_position = text[:200]
+                break
+        fields['market_position'] = market_position
+    # Hunter.io enrichment, only if any of its fields are selected
+    if wanted & set(HUNTER_FIELDS):
+        domain = utils.get_registered_domain(url)
+        hunter_data = enrich_with_hunter(domain) if domain else {}
+        fields.update((k, v) for k, v in hunter_data.items() if k in wanted)
+    if not contact_fields and not any(value for field, value in fields.items() if field != 'website'):
+        raise DataExtractionError("None of the selected fields found on page.")
+    return CompanyRecord(**fields)
+
+
+def fetch_and_extract_adaptive(url: str, proxy: str = None, config: dict = None,
+                               verdicts: Dict[str, bool] = None) -> CompanyRecord:
+    """
+    Fetch a page statically and escalate to Selenium only when needed.
+    Static extraction is always tried first. A page is re-rendered in the
+    browser if its HTML looks like a client-rendered shell and static
+    extraction found nothing beyond what a shell usually still carries
+    (title, meta description, script-tag tech keywords). The outcome is stored per host in verdicts
+    (True = needs browser), so later URLs on the same host go straight to
+    the right fetcher; a shell page never marks its host as static.
+    Args:
+        url (str): The URL to fetch.
+        proxy (str): Proxy URL for the static request.
+        config (dict): Extraction config.
+        verdicts (Dict[str, bool]): Per-host rendering verdicts, updated in place.
+    Returns:
+        CompanyRecord: The extracted record. If the browser render fails, the
+        static record is returned when there is one.
+    Raises:
+        NetworkError: If the page cannot be fetched.
+        DataExtractionError: If no company info is found.
+    """
+    verdicts = {} if verdicts is None else verdicts
+    host = urlsplit(url).hostname or ''
+    if verdicts.get(host):
+        return extract_company_info(fetch_page(url, dynamic=True), url, config=config)
+    html = fetch_page(url, proxy=proxy)
+    info = None
+    try:
+        info = extract_company_info(html, url, config=config)
+    except DataExtractionError:
+        if host in verdicts or not looks_client_rendered(html):
+            raise
+    else:
+        if host in verdicts or _has_page_content(info) or not looks_client_rendered(html):
+            verdicts.setdefault(host, False)
+            return info
+    utils.log_info(f"Escalating {url} to browser rendering")
+    try:
+        rendered = extract_company_info(fetch_page(url, dynamic=True), url, config=config)
+    except (NetworkError, DataExtractionError):
+        # The browser did not help; keep the rest of this host static
+        verdicts[host] = False
+        if info is None:
+            raise
+        return info
+    verdicts[host] = True
+    return rendered
 
 
-def process_urls(urls: List[str], dynamic: bool = False, delay: list = [1.0, 3.0], proxies: list = None, config: dict = None) -> List[Dict[str, str]]:
+def _has_page_content(info: CompanyRecord) -> bool:
+    """
+    Return True if a record has values from the page body. SHELL_FIELDS and
+    Hunter.io fields don't count, since client-rendered shells usually carry
+    a title, a meta description and framework script tags.
+    """
+    return any(value for field, value in info.items()
+               if field not in SHELL_FIELDS and field not in HUNTER_FIELDS)
+
+
+def process_urls(urls: List[str], dynamic: Union[bool, str] = False, delay: list = [1.0, 3.0], proxies: list = None, config: dict = None) -> List[CompanyRecord]:
+    """
+    Fetch and extract company info from each URL.
+    Args:
+        urls (List[str]): URLs to process.
+        dynamic (bool or str): True to render every page with Selenium, 'auto'
+            to fetch statically and escalate client-rendered pages, False for static only.
+        delay (list): Min and max delay (in seconds) between requests.
+        proxies (list): Proxy URLs to rotate through.
+        config (dict): Extraction config.
+    Returns:
+        List[CompanyRecord]: Extracted records.
+    """
     results = []
     proxy_list = proxies or []
     proxy_idx = 0
     errors = 0
+    verdicts = {}
     utils.log_info(f"Processing {len(urls)} URLs...")
     for url in tqdm(urls, desc="Scraping", unit="url"):
         try:
             proxy = proxy_list[proxy_idx % len(proxy_list)] if proxy_list else None
-            html = fetch_page(url, dynamic=dynamic, proxy=proxy)
-            info = extract_company_info(html, url, config=config)
+            if dynamic == 'auto':
+                info = fetch_and_extract_adaptive(url, proxy=proxy, config=config, verdicts=verdicts)
+            else:
+                html = fetch_page(url, dynamic=dynamic, proxy=proxy)
+                info = extract_company_info(html, url, config=config)
             results.append(info)
             utils.log_info(f"SUCCESS: {url}")
             time.sleep(utils.get_delay(delay[0], delay[1]))
@@ -286,5 +399,8 @@ def process_urls(urls: List[str], dynamic: bool = False, delay: list = [1.0, 3.0
             utils.log_info(f"ERROR: {url} - {e}")
             continue
     utils.log_info(f"Summary: {len(results)} successful, {errors} errors, {len(urls)} total.")
+    if dynamic == 'auto':
+        browser_hosts = sum(1 for needs_browser in verdicts.values() if needs_browser)
+        utils.log_info(f"Browser rendering used for {browser_hosts} of {len(verdicts)} hosts.")
     print(f"\nSummary: {len(results)} successful, {errors} errors, {len(urls)} total.")
     return results
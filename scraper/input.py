@@ -6,33 +6,43 @@ from typing import List, Union
 import argparse
 import re
 import requests
-from scraper.errors import InvalidURLError, URLUnreachableError
+from scraper.errors import InvalidURLError, URLUnreachableError, NetworkError
+from scraper import retry, utils
 
 
 def parse_args() -> dict:
     """
     Parse command-line arguments to get a search query or a list of seed URLs and all flags.
     Returns:
-        dict: {'query': str or None, 'urls': list or None, 'dynamic': bool, 'paginate': bool, 'delay': list, 'proxies': str or None, 'config': str or None}
+        dict: {'query': str or None, 'urls': list or None, 'dynamic': bool or 'auto', 'paginate': bool, 'delay': list, 'proxies': str or None, 'config': str or None, 'parquet': bool, 'timeout': float or None, 'retries': int or None, 'fields': list or None}
     """
     parser = argparse.ArgumentParser(description="Web Scraper Input")
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument('--query', type=str, help='Search query to generate URLs')
     group.add_argument('--urls', nargs='+', help='List of seed URLs')
-    parser.add_argument('--dynamic', action='store_true', help='Enable dynamic content fetching (Selenium)')
+    parser.add_argument('--dynamic', nargs='?', const='always', choices=['always', 'auto'],
+                        help="Enable dynamic content fetching (Selenium) for every page, or 'auto' to use it only for client-rendered pages")
     parser.add_argument('--paginate', action='store_true', help='Enable pagination crawling')
     parser.add_argument('--delay', nargs=2, type=float, metavar=('MIN', 'MAX'), default=[1.0, 3.0], help='Min and max delay (in seconds) between requests')
     parser.add_argument('--proxies', type=str, help='Path to file containing list of proxies (one per line)')
     parser.add_argument('--config', type=str, help='Path to YAML config file for custom selectors/regex')
+    parser.add_argument('--timeout', type=float, help='Read timeout (in seconds) for each HTTP request (default 10)')
+    parser.add_argument('--retries', type=int, help='Retries for transient HTTP failures (default 2)')
+    parser.add_argument('--fields', nargs='+', help="Fields to extract, e.g. company_name email phone (groups: social, hunter; default: all)")
+    parser.add_argument('--parquet', action='store_true', help='Also write results to output.parquet (requires pyarrow)')
     args = parser.parse_args()
     return {
         'query': args.query,
         'urls': args.urls,
-        'dynamic': args.dynamic,
+        'dynamic': 'auto' if args.dynamic == 'auto' else bool(args.dynamic),
         'paginate': args.paginate,
         'delay': args.delay,
         'proxies': args.proxies,
-        'config': args.config
+        'config': args.config,
+        'parquet': args.parquet,
+        'timeout': args.timeout,
+        'retries': args.retries,
+        'fields': args.fields
     }
 
 
@@ -63,21 +73,25 @@ def validate_urls(urls: List[str]) -> List[str]:
 def check_reachability(urls: List[str]) -> List[str]:
     """
     Check if each URL is reachable (HTTP 200 OK).
+    Uses the shared retrying client, so transient failures are retried and
+    hosts with an open circuit are skipped without waiting for a timeout.
+    Unreachable URLs are logged and left out rather than aborting the run.
     Args:
         urls (List[str]): List of URLs to check.
     Returns:
         List[str]: List of reachable URLs.
-    Raises:
-        URLUnreachableError: If any URL is not reachable.
     """
+    client = retry.get_client()
     reachable = []
     for url in urls:
         try:
-            resp = requests.head(url, timeout=5, allow_redirects=True)
-            if resp.status_code == 200:
-                reachable.append(url)
-            else:
+            try:
+                resp = client.request('HEAD', url, allow_redirects=True)
+            except (requests.RequestException, NetworkError) as e:
+                raise URLUnreachableError(f"URL not reachable: {url} ({e})")
+            if resp.status_code != 200:
                 raise URLUnreachableError(f"URL not reachable (status {resp.status_code}): {url}")
-        except requests.RequestException as e:
-            raise URLUnreachableError(f"URL not reachable: {url} ({e})")
+            reachable.append(url)
+        except URLUnreachableError as e:
+            utils.log_error(str(e))
     return reachable
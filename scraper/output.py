@@ -1,34 +1,77 @@
 """
 output.py
-Handles outputting extracted data to CSV or JSON formats.
+Handles outputting extracted data to CSV, JSON or Parquet formats.
 """
-from typing import List, Dict
+from typing import Iterable, List
 import csv
 import json
+from scraper.records import ALL_FIELDS, CompanyRecord, output_fields
 
 
-def write_csv(data: List[Dict[str, str]], filename: str) -> None:
+def write_csv(data: List[CompanyRecord], filename: str, fields: Iterable[str] = ALL_FIELDS) -> None:
     """
     Write extracted data to a CSV file.
     Args:
-        data (List[Dict[str, str]]): List of extracted company info dicts.
+        data (List[CompanyRecord]): List of extracted company records.
         filename (str): Output CSV file name.
+        fields (Iterable[str]): Fields to write (default: all).
     """
     if not data:
         return
-    fieldnames = list(data[0].keys())
+    fieldnames = output_fields(data, fields)
     with open(filename, mode='w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(record.values(fieldnames) for record in data)
 
 
-def write_json(data: List[Dict[str, str]], filename: str) -> None:
+def write_json(data: List[CompanyRecord], filename: str, fields: Iterable[str] = ALL_FIELDS) -> None:
     """
     Write extracted data to a JSON file.
+    Records are serialized one at a time rather than as one large list of dicts.
     Args:
-        data (List[Dict[str, str]]): List of extracted company info dicts.
+        data (List[CompanyRecord]): List of extracted company records.
         filename (str): Output JSON file name.
+        fields (Iterable[str]): Fields to write (default: all).
     """
+    wanted = set(fields)
+    selected = tuple(field for field in ALL_FIELDS if field in wanted)
     with open(filename, mode='w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        if not data:
+            f.write('[]')
+            return
+        f.write('[\n')
+        for i, record in enumerate(data):
+            if i:
+                f.write(',\n')
+            item = json.dumps(record.to_dict(selected), ensure_ascii=False, indent=2)
+            f.write('\n'.join('  ' + line for line in item.splitlines()))
+        f.write('\n]')
+
+
+def parquet_available() -> bool:
+    """Return True if pyarrow is installed and Parquet export is possible."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def write_parquet(data: List[CompanyRecord], filename: str, fields: Iterable[str] = ALL_FIELDS) -> None:
+    """
+    Write extracted data to a Parquet file, one column per field.
+    Requires the optional pyarrow dependency.
+    Args:
+        data (List[CompanyRecord]): List of extracted company records.
+        filename (str): Output Parquet file name.
+        fields (Iterable[str]): Fields to write (default: all).
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    fieldnames = output_fields(data, fields) if data else ()
+    columns = {field: pa.array([getattr(r, field) for r in data], type=pa.string())
+               for field in fieldnames}
+    pq.write_table(pa.table(columns), filename)
@@ -0,0 +1,147 @@
+"""
+records.py
+Compact, fixed-schema representation of an extracted company record.
+"""
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+import sys
+from scraper.errors import InvalidFieldError
+
+# Fields produced by extract_company_info, in output column order
+FIELDS = (
+    'company_name', 'website', 'email', 'phone',
+    'linkedin', 'twitter', 'facebook', 'instagram',
+    'address', 'description', 'year_founded', 'products', 'services', 'industry',
+    'tech_stack', 'projects', 'competitors', 'market_position',
+)
+
+# Fields added by Hunter.io enrichment
+HUNTER_FIELDS = (
+    'hunter_company', 'hunter_industry', 'hunter_emails', 'hunter_country',
+    'hunter_state', 'hunter_city', 'hunter_phone', 'hunter_linkedin',
+)
+
+ALL_FIELDS = FIELDS + HUNTER_FIELDS
+
+# Shorthand names accepted in a field selection
+FIELD_GROUPS = {
+    'social': ('linkedin', 'twitter', 'facebook', 'instagram'),
+    'hunter': HUNTER_FIELDS,
+}
+
+# Low-cardinality fields whose values repeat across many records
+INTERNED_FIELDS = frozenset({
+    'year_founded', 'tech_stack', 'hunter_industry', 'hunter_country',
+    'hunter_state', 'hunter_city',
+})
+
+
+class CompanyRecord:
+    """
+    One company record with a fixed set of string fields.
+    Uses __slots__ instead of a per-record dict, and interns repeated values
+    of low-cardinality fields so identical strings are stored once.
+    Supports the read/write mapping operations used by the rest of the
+    scraper (get, [], items, copy).
+    """
+    __slots__ = ALL_FIELDS
+
+    def __init__(self, **fields: str):
+        for field in ALL_FIELDS:
+            self._set(field, fields.pop(field, ''))
+        if fields:
+            raise TypeError(f"Unknown record fields: {', '.join(sorted(fields))}")
+
+    def _set(self, field: str, value: str) -> None:
+        value = value or ''
+        if field in INTERNED_FIELDS and value:
+            value = sys.intern(value)
+        setattr(self, field, value)
+
+    def __getitem__(self, field: str) -> str:
+        if field not in ALL_FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __setitem__(self, field: str, value: str) -> None:
+        if field not in ALL_FIELDS:
+            raise KeyError(field)
+        self._set(field, value)
+
+    def get(self, field: str, default: str = None) -> str:
+        return getattr(self, field) if field in ALL_FIELDS else default
+
+    def has_hunter_data(self) -> bool:
+        """Return True if any Hunter.io field is set."""
+        return any(getattr(self, field) for field in HUNTER_FIELDS)
+
+    def fields(self, selected: Tuple[str, ...] = ALL_FIELDS) -> Tuple[str, ...]:
+        """Return the selected field names present in this record's output."""
+        if self.has_hunter_data():
+            return selected
+        return tuple(field for field in selected if field not in HUNTER_FIELDS)
+
+    def items(self, selected: Tuple[str, ...] = ALL_FIELDS) -> Iterator[Tuple[str, str]]:
+        for field in self.fields(selected):
+            yield field, getattr(self, field)
+
+    def values(self, fields: Tuple[str, ...] = ALL_FIELDS) -> List[str]:
+        """Return the values of the given fields, in order."""
+        return [getattr(self, field) for field in fields]
+
+    def to_dict(self, selected: Tuple[str, ...] = ALL_FIELDS) -> Dict[str, str]:
+        """Return a plain dict of the selected fields, omitting Hunter.io fields if none are set."""
+        return dict(self.items(selected))
+
+    def copy(self) -> 'CompanyRecord':
+        clone = CompanyRecord.__new__(CompanyRecord)
+        for field in ALL_FIELDS:
+            setattr(clone, field, getattr(self, field))
+        return clone
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompanyRecord):
+            return NotImplemented
+        return self.values() == other.values()
+
+    def __repr__(self) -> str:
+        return f"CompanyRecord(company_name={self.company_name!r}, website={self.website!r})"
+
+
+def resolve_fields(names: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """
+    Expand a field selection (field names or FIELD_GROUPS shorthands) into a
+    set of field names. 'website' is always included.
+    Args:
+        names (Iterable[str] or None): Requested fields; None or empty selects all.
+    Returns:
+        FrozenSet[str]: The selected field names.
+    Raises:
+        InvalidFieldError: If a name is neither a field nor a group, or if
+            the selection contains nothing but 'website'.
+    """
+    if not names:
+        return frozenset(ALL_FIELDS)
+    if isinstance(names, str):
+        names = names.replace(',', ' ').split()
+    selected = {'website'}
+    for name in names:
+        if name in FIELD_GROUPS:
+            selected.update(FIELD_GROUPS[name])
+        elif name in ALL_FIELDS:
+            selected.add(name)
+        else:
+            raise InvalidFieldError(f"Unknown field: {name}")
+    if selected == {'website'}:
+        raise InvalidFieldError("Selection contains only 'website', which is always included; select at least one other field")
+    return frozenset(selected)
+
+
+def output_fields(records: List[CompanyRecord], selected: Iterable[str] = ALL_FIELDS) -> Tuple[str, ...]:
+    """
+    Return the output columns for a list of records: the selected base
+    fields, plus the selected Hunter.io fields if any record was enriched.
+    """
+    has_hunter = any(r.has_hunter_data() for r in records)
+    selected = set(selected)
+    return tuple(field for field in ALL_FIELDS
+                 if field in selected and (has_hunter or field not in HUNTER_FIELDS))
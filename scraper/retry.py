@@ -0,0 +1,195 @@
+"""
+retry.py
+HTTP requests with retry/backoff and a per-host circuit breaker.
+"""
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import random
+import time
+import requests
+from scraper.errors import CircuitOpenError
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Exceptions worth retrying: the request may succeed on a later attempt
+RETRY_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class RetryPolicy:
+    """
+    Decides whether and when to retry a request.
+    Uses exponential backoff with full jitter: the wait before attempt n is a
+    random value between 0 and min(backoff_max, backoff_base * 2 ** n).
+    Retries stop after max_attempts, or when the next wait would exceed the
+    total time budget for the request.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff_base: float = 0.5,
+                 backoff_max: float = 10.0, budget: float = 30.0):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.budget = budget
+
+    def should_retry_status(self, status_code: int) -> bool:
+        return status_code in RETRY_STATUSES
+
+    def should_retry_exception(self, exc: Exception) -> bool:
+        return isinstance(exc, RETRY_EXCEPTIONS)
+
+    def backoff(self, attempt: int) -> float:
+        """Return the wait in seconds after the given (0-based) failed attempt."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+    After failure_threshold consecutive failures a host's circuit opens and
+    requests to it fail fast. Once reset_timeout seconds have passed, a single
+    half-open probe is allowed through: success closes the circuit, failure
+    opens it again.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._probing: Dict[str, bool] = {}
+
+    def state(self, host: str) -> str:
+        if host not in self._opened_at:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at[host] >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self, host: str) -> bool:
+        """Return True if a request to host may be sent now."""
+        state = self.state(host)
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probing.get(host):
+            self._probing[host] = True
+            return True
+        return False
+
+    def release(self, host: str) -> None:
+        """Give up a half-open probe without recording an outcome."""
+        self._probing.pop(host, None)
+
+    def record_success(self, host: str) -> None:
+        self._failures.pop(host, None)
+        self._opened_at.pop(host, None)
+        self._probing.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        failures = self._failures.get(host, 0) + 1
+        self._failures[host] = failures
+        if self._probing.pop(host, None) or failures >= self.failure_threshold:
+            self._opened_at[host] = time.monotonic()
+
+
+class HttpClient:
+    """
+    Sends HTTP requests through a RetryPolicy and a shared CircuitBreaker.
+    """
+
+    def __init__(self, timeout: Tuple[float, float] = (5.0, 10.0),
+                 policy: Optional[RetryPolicy] = None,
+                 breaker: Optional[CircuitBreaker] = None):
+        self.timeout = timeout
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying transient failures.
+        Returns the final response, which may still carry an error status;
+        callers decide whether to call raise_for_status().
+        Proxy errors are raised immediately and do not count against the host.
+        Raises:
+            CircuitOpenError: If the host's circuit is open.
+            requests.RequestException: If the last attempt raised.
+        """
+        host = urlsplit(url).hostname or ''
+        if not self.breaker.allow(host):
+            raise CircuitOpenError(f"Circuit open for {host}; skipping {url}")
+        kwargs.setdefault('timeout', self.timeout)
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            error = None
+            try:
+                resp = requests.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                # A proxy failure says nothing about the target host, and
+                # retrying through the same proxy will not help
+                if isinstance(e, requests.exceptions.ProxyError) or \
+                        not self.policy.should_retry_exception(e):
+                    self.breaker.release(host)
+                    raise
+                error = e
+            else:
+                if not self.policy.should_retry_status(resp.status_code):
+                    self.breaker.record_success(host)
+                    return resp
+            delay = self.policy.backoff(attempt)
+            attempt += 1
+            if attempt >= self.policy.max_attempts or \
+                    time.monotonic() - start + delay > self.policy.budget:
+                self.breaker.record_failure(host)
+                if error is not None:
+                    raise error
+                return resp
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+
+_client = HttpClient()
+
+
+def configure(config: dict = None) -> HttpClient:
+    """
+    Replace the shared client using settings from a config dict (YAML/CLI).
+    Recognised keys: connect_timeout, timeout, max_retries, backoff_base,
+    backoff_max, retry_budget, breaker_threshold, breaker_reset.
+    Returns:
+        HttpClient: The new shared client.
+    """
+    global _client
+    config = config or {}
+    policy = RetryPolicy(
+        max_attempts=int(config.get('max_retries', 2)) + 1,
+        backoff_base=float(config.get('backoff_base', 0.5)),
+        backoff_max=float(config.get('backoff_max', 10.0)),
+        budget=float(config.get('retry_budget', 30.0)),
+    )
+    breaker = CircuitBreaker(
+        failure_threshold=int(config.get('breaker_threshold', 5)),
+        reset_timeout=float(config.get('breaker_reset', 60.0)),
+    )
+    timeout = (float(config.get('connect_timeout', 5.0)), float(config.get('timeout', 10.0)))
+    _client = HttpClient(timeout=timeout, policy=policy, breaker=breaker)
+    return _client
+
+
+def get_client() -> HttpClient:
+    """Return the shared client used by fetching, pagination and enrichment."""
+    return _client
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Send a GET request through the shared client."""
+    return _client.get(url, **kwargs)
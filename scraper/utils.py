@@ -5,10 +5,13 @@ Shared utility functions for validation, logging, etc.
 import sys
 from datetime import datetime
 import random
-import yaml
 
 LOG_FILE = "scraper_errors.log"
 
+# Lazily created on first use; see get_registered_domain() and load_env().
+_tld_extractor = None
+_env_loaded = False
+
 def log_error(message: str) -> None:
     """
     Log an error message to the console and append to a log file.
@@ -61,10 +64,42 @@ def load_config(config_file: str) -> dict:
     Load YAML config file for custom selectors/regex.
     Returns a dict or empty dict if not found/invalid.
     """
+    import yaml
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
             return yaml.safe_load(f) or {}
     except Exception:
         return {}
 
+def load_env() -> None:
+    """
+    Load variables from a local .env file once per process.
+    python-dotenv is optional and only imported when an API key is needed.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()  # For demo only; use env var in production
+
+def get_registered_domain(url: str) -> str:
+    """
+    Return the registered domain (e.g. 'python.org') of a URL.
+    Uses the public suffix snapshot bundled with tldextract, loaded once per
+    process, so domain parsing never touches the network. Private suffixes
+    such as github.io or herokuapp.com are honoured, so 'foo.github.io' and
+    'bar.github.io' are different domains.
+    Returns an empty string if the URL has no recognisable domain.
+    """
+    global _tld_extractor
+    if _tld_extractor is None:
+        import tldextract
+        _tld_extractor = tldextract.TLDExtract(suffix_list_urls=(), include_psl_private_domains=True)
+    ext = _tld_extractor(url)
+    return f"{ext.domain}.{ext.suffix}" if ext.domain and ext.suffix else ''
+
 # Additional utility functions can be added here as needed.
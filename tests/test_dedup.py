@@ -0,0 +1,74 @@
+"""
+Tests for dedup.py: URL canonicalization, the URL index and record merging.
+"""
+import pytest
+from scraper import dedup
+from scraper.records import CompanyRecord
+
+
+@pytest.mark.parametrize('a, b', [
+    ('http://example.com/about', 'https://example.com/about'),
+    ('https://www.example.com/about', 'https://example.com/about'),
+    ('https://example.com/about/', 'https://example.com/about'),
+    ('https://example.com/', 'example.com'),
+    ('https://example.com/about#team', 'https://example.com/about'),
+    ('https://example.com/about?utm_source=x&utm_medium=y', 'https://example.com/about'),
+    ('https://example.com/p?gclid=1&id=2', 'https://example.com/p?id=2'),
+    ('https://example.com/p?b=2&a=1', 'https://example.com/p?a=1&b=2'),
+    ('https://EXAMPLE.com:443/p', 'http://example.com:80/p'),
+])
+def test_equivalent_urls_share_a_key(a, b):
+    assert dedup.canonicalize_url(a) == dedup.canonicalize_url(b)
+
+
+@pytest.mark.parametrize('a, b', [
+    ('https://example.com/about', 'https://example.com/contact'),
+    ('https://example.com/p?id=1', 'https://example.com/p?id=2'),
+    ('https://github.com/o/r?ref=main', 'https://github.com/o/r?ref=dev'),
+    ('https://example.com:8080/', 'https://example.com/'),
+    ('https://shop.example.com/', 'https://example.com/'),
+])
+def test_different_pages_have_different_keys(a, b):
+    assert dedup.canonicalize_url(a) != dedup.canonicalize_url(b)
+
+
+def test_ipv6_host_keeps_brackets():
+    assert dedup.canonicalize_url('http://[::1]:8080/a') == '[::1]:8080/a'
+
+
+def test_dedupe_keeps_first_original_url():
+    urls = [
+        'https://example.com/x?flag&q=%20',
+        'http://www.example.com/x/?q=+&flag=#top',
+        'https://example.com/y',
+    ]
+    assert dedup.dedupe_urls(urls) == ['https://example.com/x?flag&q=%20', 'https://example.com/y']
+
+
+def test_index_groups_by_registered_domain():
+    index = dedup.URLIndex(['https://a.com/', 'https://blog.a.com/post', 'https://b.com/'])
+    assert 'http://www.a.com' in index
+    assert len(index.by_domain['a.com']) == 2
+    assert len(index.by_domain['b.com']) == 1
+
+
+def test_merge_prefers_root_page_and_fills_gaps():
+    records = [
+        CompanyRecord(website='https://a.com/about', company_name='About us', phone='123'),
+        CompanyRecord(website='https://www.a.com/', company_name='Acme', email=''),
+        CompanyRecord(website='https://a.com/contact', email='hi@a.com'),
+    ]
+    merged = dedup.merge_records(records)
+    assert len(merged) == 1
+    assert merged[0].website == 'https://www.a.com/'
+    assert merged[0].company_name == 'Acme'
+    assert merged[0].phone == '123'
+    assert merged[0].email == 'hi@a.com'
+
+
+def test_merge_keeps_private_suffix_sites_apart():
+    records = [
+        CompanyRecord(website='https://foo.github.io/', company_name='Foo'),
+        CompanyRecord(website='https://bar.github.io/', company_name='Bar'),
+    ]
+    assert [r.company_name for r in dedup.merge_records(records)] == ['Foo', 'Bar']
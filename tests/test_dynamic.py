@@ -0,0 +1,119 @@
+"""
+Tests for adaptive rendering: looks_client_rendered and fetch_and_extract_adaptive.
+"""
+import pytest
+from scraper import extract, utils
+from scraper.dynamic import looks_client_rendered
+from scraper.errors import DataExtractionError, NetworkError
+
+SHELL = ('<html><head><title>Acme</title></head><body>'
+         '<div id="root"></div><script src="/main.js"></script></body></html>')
+SSR_WITH_PORTAL = ('<html><head><title>Acme</title></head><body><div id="app"></div>'
+                   '<p>' + 'Acme builds industrial widgets for factories. ' * 30 + '</p>'
+                   '<a href="mailto:info@acme.com">Contact</a></body></html>')
+SMALL_STATIC = ('<html><body><h1>Acme</h1>'
+                '<a href="mailto:info@acme.com">Mail</a></body></html>')
+RENDERED = ('<html><head><title>Acme</title></head><body><h1>Acme</h1>'
+            '<a href="mailto:info@acme.com">Mail</a></body></html>')
+
+
+@pytest.fixture
+def pages(monkeypatch, tmp_path):
+    """Serve static/rendered HTML per host from a dict and record each fetch."""
+    calls = []
+    static = {}
+    rendered = {}
+
+    def fake_fetch_page(url, dynamic=False, proxy=None):
+        calls.append((url, dynamic))
+        host = url.split('//', 1)[1].split('/', 1)[0]
+        source = rendered if dynamic else static
+        if host not in source:
+            raise NetworkError(f"Dynamic fetch failed for {url}")
+        return source[host]
+
+    monkeypatch.setattr(extract, 'fetch_page', fake_fetch_page)
+    monkeypatch.setattr(extract, 'enrich_with_hunter', lambda domain: {})
+    monkeypatch.setattr(utils, 'LOG_FILE', str(tmp_path / 'scraper.log'))
+    return calls, static, rendered
+
+
+@pytest.mark.parametrize('html, expected', [
+    (SHELL, True),
+    ('<html><body></body></html>', True),
+    ('<html><body><noscript>Please enable JavaScript to continue.</noscript></body></html>', True),
+    (SSR_WITH_PORTAL, False),
+    ('<body><div id="application"></div><p>' + 'word ' * 20 + '</p></body>', False),
+    ('<body><div id=rooted></div><p>' + 'word ' * 20 + '</p></body>', False),
+])
+def test_looks_client_rendered(html, expected):
+    assert looks_client_rendered(html) is expected
+
+
+def test_shell_with_title_is_escalated(pages):
+    calls, static, rendered = pages
+    static['acme.com'] = SHELL
+    rendered['acme.com'] = RENDERED
+    verdicts = {}
+    info = extract.fetch_and_extract_adaptive('https://acme.com/', verdicts=verdicts)
+    assert info.email == 'info@acme.com'
+    assert verdicts == {'acme.com': True}
+    assert calls == [('https://acme.com/', False), ('https://acme.com/', True)]
+
+
+def test_server_rendered_page_with_empty_portal_stays_static(pages):
+    calls, static, rendered = pages
+    static['acme.com'] = SSR_WITH_PORTAL
+    verdicts = {}
+    info = extract.fetch_and_extract_adaptive('https://acme.com/', verdicts=verdicts)
+    assert info.email == 'info@acme.com'
+    assert verdicts == {'acme.com': False}
+    assert calls == [('https://acme.com/', False)]
+
+
+def test_small_static_page_stays_static(pages):
+    calls, static, rendered = pages
+    static['acme.com'] = SMALL_STATIC
+    verdicts = {}
+    info = extract.fetch_and_extract_adaptive('https://acme.com/', verdicts=verdicts)
+    assert info.email == 'info@acme.com'
+    assert verdicts == {'acme.com': False}
+    assert all(not dynamic for _, dynamic in calls)
+
+
+def test_host_verdict_is_reused(pages):
+    calls, static, rendered = pages
+    static['acme.com'] = SHELL
+    rendered['acme.com'] = RENDERED
+    verdicts = {}
+    extract.fetch_and_extract_adaptive('https://acme.com/a', verdicts=verdicts)
+    calls.clear()
+    extract.fetch_and_extract_adaptive('https://acme.com/b', verdicts=verdicts)
+    assert calls == [('https://acme.com/b', True)]
+
+
+def test_static_verdict_is_reused(pages):
+    calls, static, rendered = pages
+    static['acme.com'] = SMALL_STATIC
+    verdicts = {'acme.com': False}
+    extract.fetch_and_extract_adaptive('https://acme.com/b', verdicts=verdicts)
+    assert calls == [('https://acme.com/b', False)]
+
+
+def test_failed_escalation_returns_static_record(pages):
+    calls, static, rendered = pages
+    static['acme.com'] = SHELL  # no rendered page: the browser fetch fails
+    verdicts = {}
+    info = extract.fetch_and_extract_adaptive('https://acme.com/', verdicts=verdicts)
+    assert info.company_name == 'Acme'
+    assert verdicts == {'acme.com': False}
+
+
+def test_failed_escalation_without_static_record_raises(pages):
+    calls, static, rendered = pages
+    static['acme.com'] = '<html><body><div id="root"></div></body></html>'
+    rendered['acme.com'] = '<html><body><div id="root"></div></body></html>'
+    verdicts = {}
+    with pytest.raises(DataExtractionError):
+        extract.fetch_and_extract_adaptive('https://acme.com/', verdicts=verdicts)
+    assert verdicts == {'acme.com': False}
@@ -0,0 +1,129 @@
+"""
+Tests for field selection: records.resolve_fields and field-limited extraction.
+"""
+import pytest
+from scraper import extract
+from scraper.errors import DataExtractionError, InvalidFieldError
+from scraper.records import ALL_FIELDS, HUNTER_FIELDS, resolve_fields
+
+PAGE = ('<html><head><title>Acme</title>'
+        '<meta name="description" content="Widgets for everyone"></head><body>'
+        '<section><p>Our products include widgets. We are a market leader.</p></section>'
+        '<a href="mailto:info@acme.com">Mail</a> <a href="tel:+15551234567">Call</a>'
+        '<a href="https://linkedin.com/company/acme">LinkedIn</a>'
+        '<script src="/static/react.js"></script></body></html>')
+HUNTER_DATA = {'hunter_company': 'Acme Inc', 'hunter_country': 'US'}
+
+
+@pytest.fixture
+def hunter(monkeypatch):
+    """Replace the Hunter.io call and record the domains it was called with."""
+    calls = []
+
+    def fake_enrich(domain):
+        calls.append(domain)
+        return dict(HUNTER_DATA)
+
+    monkeypatch.setattr(extract, 'enrich_with_hunter', fake_enrich)
+    return calls
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Record the keyword arguments of every BeautifulSoup parse."""
+    calls = []
+    real = extract.BeautifulSoup
+
+    def spy(*args, **kwargs):
+        calls.append(kwargs)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(extract, 'BeautifulSoup', spy)
+    return calls
+
+
+def test_resolve_fields_defaults_to_all():
+    assert resolve_fields(None) == frozenset(ALL_FIELDS)
+    assert resolve_fields([]) == frozenset(ALL_FIELDS)
+
+
+def test_resolve_fields_expands_groups_and_adds_website():
+    assert resolve_fields(['email', 'social']) == {
+        'website', 'email', 'linkedin', 'twitter', 'facebook', 'instagram'}
+    assert resolve_fields(['hunter']) == {'website'} | set(HUNTER_FIELDS)
+
+
+def test_resolve_fields_accepts_comma_string():
+    assert resolve_fields('company_name, email phone') == {
+        'website', 'company_name', 'email', 'phone'}
+
+
+def test_resolve_fields_rejects_unknown_field():
+    with pytest.raises(InvalidFieldError):
+        resolve_fields(['email', 'nope'])
+
+
+def test_resolve_fields_rejects_website_only():
+    with pytest.raises(InvalidFieldError):
+        resolve_fields(['website'])
+
+
+def test_contact_fields_use_light_parse(hunter, parse_calls):
+    info = extract.extract_company_info(PAGE, 'https://acme.com/',
+                                        {'fields': ['company_name', 'email', 'phone', 'social']})
+    assert (info.company_name, info.email, info.phone) == ('Acme', 'info@acme.com', '+15551234567')
+    assert info.linkedin == 'https://linkedin.com/company/acme'
+    assert parse_calls[0].get('parse_only') is not None
+    # Unselected fields are not computed, and Hunter.io is not called
+    assert info.products == '' and info.tech_stack == '' and info.description == ''
+    assert hunter == []
+
+
+def test_custom_selector_forces_full_parse(hunter, parse_calls):
+    config = {'fields': ['company_name'], 'company_name_selector': 'h1'}
+    extract.extract_company_info(PAGE, 'https://acme.com/', config)
+    assert parse_calls[0].get('parse_only') is None
+
+
+def test_heavy_field_uses_full_parse(hunter, parse_calls):
+    info = extract.extract_company_info(PAGE, 'https://acme.com/', {'fields': ['email', 'products']})
+    assert parse_calls[0].get('parse_only') is None
+    assert 'products' in info.products
+
+
+def test_all_fields_call_hunter(hunter):
+    info = extract.extract_company_info(PAGE, 'https://acme.com/')
+    assert hunter == ['acme.com']
+    assert info.hunter_company == 'Acme Inc'
+    assert info.tech_stack
+
+
+def test_hunter_only_selection(hunter):
+    info = extract.extract_company_info('<html></html>', 'https://acme.com/', {'fields': ['hunter']})
+    assert hunter == ['acme.com']
+    assert info.hunter_company == 'Acme Inc'
+    assert info.hunter_country == 'US'
+
+
+def test_single_hunter_field_keeps_only_that_field(hunter):
+    info = extract.extract_company_info('<html></html>', 'https://acme.com/',
+                                        {'fields': ['hunter_company']})
+    assert info.hunter_company == 'Acme Inc'
+    assert info.hunter_country == ''
+
+
+def test_hunter_only_selection_without_data_raises(monkeypatch):
+    monkeypatch.setattr(extract, 'enrich_with_hunter', lambda domain: {})
+    with pytest.raises(DataExtractionError):
+        extract.extract_company_info('<html></html>', 'https://acme.com/', {'fields': ['hunter']})
+
+
+def test_non_contact_selection_with_nothing_found_raises(hunter):
+    with pytest.raises(DataExtractionError):
+        extract.extract_company_info('<html></html>', 'https://acme.com/', {'fields': ['products']})
+
+
+def test_contact_selection_with_no_contact_found_raises(hunter):
+    with pytest.raises(DataExtractionError):
+        extract.extract_company_info('<html><body><p>products</p></body></html>', 'https://acme.com/',
+                                     {'fields': ['email', 'products']})
@@ -0,0 +1,129 @@
+"""
+Tests for records.py and output.py: CompanyRecord and the CSV/JSON/Parquet writers.
+"""
+import csv
+import json
+import pytest
+from scraper import output
+from scraper.records import ALL_FIELDS, FIELDS, HUNTER_FIELDS, CompanyRecord
+
+
+def make_records(enriched=False):
+    first = CompanyRecord(company_name='Acme', website='https://acme.com/', email='info@acme.com',
+                          description='Widgets, "quoted"\nand multi-line')
+    second = CompanyRecord(company_name='Bücher GmbH', website='https://buecher.de/', phone='+49 30 1234')
+    if enriched:
+        second['hunter_company'] = 'Bücher'
+        second['hunter_country'] = 'DE'
+    return [first, second]
+
+
+def read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def test_record_rejects_unknown_field():
+    with pytest.raises(TypeError):
+        CompanyRecord(company_name='Acme', nickname='A')
+
+
+def test_record_mapping_access():
+    record = CompanyRecord(company_name='Acme')
+    assert record['company_name'] == 'Acme'
+    assert record.get('email') == ''
+    assert record.get('nope', 'x') == 'x'
+    with pytest.raises(KeyError):
+        record['nope'] = 'x'
+    copy = record.copy()
+    copy['email'] = 'a@acme.com'
+    assert record.email == '' and copy.email == 'a@acme.com'
+
+
+def test_record_has_no_instance_dict():
+    assert not hasattr(CompanyRecord(), '__dict__')
+
+
+def test_record_interns_repeated_values():
+    a = CompanyRecord(hunter_country=''.join(['Ger', 'many']))
+    b = CompanyRecord(hunter_country=''.join(['Germ', 'any']))
+    assert a.hunter_country is b.hunter_country
+
+
+def test_to_dict_omits_hunter_fields_unless_enriched():
+    plain, enriched = make_records(enriched=True)
+    assert tuple(plain.to_dict()) == FIELDS
+    assert tuple(enriched.to_dict()) == ALL_FIELDS
+
+
+def test_json_round_trip(tmp_path):
+    records = make_records()
+    path = tmp_path / 'out.json'
+    output.write_json(records, str(path))
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert data == [r.to_dict() for r in records]
+    assert list(data[0]) == list(FIELDS)
+
+
+def test_json_matches_json_dump_formatting(tmp_path):
+    records = make_records(enriched=True)
+    path = tmp_path / 'out.json'
+    output.write_json(records, str(path))
+    expected = json.dumps([r.to_dict() for r in records], ensure_ascii=False, indent=2)
+    assert path.read_text(encoding='utf-8') == expected
+
+
+def test_json_empty(tmp_path):
+    path = tmp_path / 'out.json'
+    output.write_json([], str(path))
+    assert json.loads(path.read_text(encoding='utf-8')) == []
+
+
+def test_csv_round_trip_and_column_order(tmp_path):
+    records = make_records()
+    path = tmp_path / 'out.csv'
+    output.write_csv(records, str(path))
+    rows = read_csv(path)
+    assert tuple(rows[0]) == FIELDS
+    assert rows[1] == records[0].values(FIELDS)
+    assert rows[2] == records[1].values(FIELDS)
+
+
+def test_csv_hunter_columns_only_when_enriched(tmp_path):
+    path = tmp_path / 'out.csv'
+    output.write_csv(make_records(enriched=True), str(path))
+    rows = read_csv(path)
+    assert tuple(rows[0]) == ALL_FIELDS
+    assert rows[2][ALL_FIELDS.index('hunter_country')] == 'DE'
+    assert rows[1][ALL_FIELDS.index('hunter_country')] == ''
+
+
+def test_writers_respect_field_selection(tmp_path):
+    records = make_records(enriched=True)
+    selected = {'company_name', 'website', 'email', 'hunter_country'}
+    csv_path = tmp_path / 'out.csv'
+    json_path = tmp_path / 'out.json'
+    output.write_csv(records, str(csv_path), selected)
+    output.write_json(records, str(json_path), selected)
+    assert read_csv(csv_path)[0] == ['company_name', 'website', 'email', 'hunter_country']
+    data = json.loads(json_path.read_text(encoding='utf-8'))
+    assert list(data[0]) == ['company_name', 'website', 'email']
+    assert list(data[1]) == ['company_name', 'website', 'email', 'hunter_country']
+
+
+def test_parquet_round_trip(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    records = make_records(enriched=True)
+    path = tmp_path / 'out.parquet'
+    output.write_parquet(records, str(path))
+    table = pq.read_table(str(path))
+    assert tuple(table.column_names) == ALL_FIELDS
+    assert table.column('company_name').to_pylist() == ['Acme', 'Bücher GmbH']
+    assert table.column('hunter_country').to_pylist() == ['', 'DE']
+
+
+def test_parquet_without_hunter_columns(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = tmp_path / 'out.parquet'
+    output.write_parquet(make_records(), str(path), {'company_name', 'website'} | set(HUNTER_FIELDS))
+    assert pq.read_table(str(path)).column_names == ['company_name', 'website']
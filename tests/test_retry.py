@@ -0,0 +1,133 @@
+"""
+Tests for retry.py: retry policy and per-host circuit breaker.
+"""
+import pytest
+import requests
+from scraper import retry
+from scraper.errors import CircuitOpenError
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """Replace requests.request with a scripted sequence of outcomes."""
+    calls = []
+    outcomes = []
+
+    def fake_request(method, url, **kwargs):
+        calls.append(url)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeResponse(outcome)
+
+    monkeypatch.setattr(retry.requests, 'request', fake_request)
+    monkeypatch.setattr(retry.time, 'sleep', lambda seconds: None)
+    return calls, outcomes
+
+
+def make_client(threshold=2, reset=60.0, attempts=3):
+    return retry.HttpClient(policy=retry.RetryPolicy(max_attempts=attempts),
+                            breaker=retry.CircuitBreaker(threshold, reset))
+
+
+def test_retries_retryable_status_then_succeeds(transport):
+    calls, outcomes = transport
+    outcomes.extend([503, 502, 200])
+    assert make_client().get('http://a.com').status_code == 200
+    assert len(calls) == 3
+
+
+def test_retries_connection_error_then_succeeds(transport):
+    calls, outcomes = transport
+    outcomes.extend([requests.ConnectionError('reset'), 200])
+    assert make_client().get('http://a.com').status_code == 200
+    assert len(calls) == 2
+
+
+def test_does_not_retry_client_error_status(transport):
+    calls, outcomes = transport
+    outcomes.append(404)
+    assert make_client().get('http://a.com').status_code == 404
+    assert len(calls) == 1
+
+
+def test_does_not_retry_non_transient_exception(transport):
+    calls, outcomes = transport
+    outcomes.append(requests.exceptions.InvalidURL('bad'))
+    with pytest.raises(requests.exceptions.InvalidURL):
+        make_client().get('http://a.com')
+    assert len(calls) == 1
+
+
+def test_returns_last_response_when_attempts_run_out(transport):
+    calls, outcomes = transport
+    outcomes.extend([503, 503, 503])
+    assert make_client().get('http://a.com').status_code == 503
+    assert len(calls) == 3
+
+
+def test_breaker_trips_after_consecutive_failures(transport):
+    calls, outcomes = transport
+    client = make_client(threshold=2, attempts=1)
+    outcomes.extend([requests.ConnectionError('down')] * 2)
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            client.get('http://down.com/page')
+    with pytest.raises(CircuitOpenError):
+        client.get('http://down.com/other')
+    assert len(calls) == 2
+    assert client.breaker.state('down.com') == retry.CircuitBreaker.OPEN
+    # Other hosts are unaffected
+    outcomes.append(200)
+    assert client.get('http://up.com').status_code == 200
+
+
+def test_breaker_half_open_probe_success_closes(transport):
+    calls, outcomes = transport
+    client = make_client(threshold=1, reset=0.0, attempts=1)
+    outcomes.extend([requests.ConnectionError('down'), 200])
+    with pytest.raises(requests.ConnectionError):
+        client.get('http://a.com')
+    assert client.breaker.state('a.com') == retry.CircuitBreaker.HALF_OPEN
+    assert client.get('http://a.com').status_code == 200
+    assert client.breaker.state('a.com') == retry.CircuitBreaker.CLOSED
+
+
+def test_breaker_half_open_allows_single_probe():
+    breaker = retry.CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure('a.com')
+    assert breaker.allow('a.com')
+    assert not breaker.allow('a.com')
+    breaker.record_failure('a.com')
+    breaker.reset_timeout = 60.0
+    assert breaker.state('a.com') == retry.CircuitBreaker.OPEN
+    assert not breaker.allow('a.com')
+
+
+def test_success_resets_failure_count():
+    breaker = retry.CircuitBreaker(failure_threshold=2)
+    breaker.record_failure('a.com')
+    breaker.record_success('a.com')
+    breaker.record_failure('a.com')
+    assert breaker.state('a.com') == retry.CircuitBreaker.CLOSED
+
+
+def test_proxy_error_not_counted_against_host(transport):
+    calls, outcomes = transport
+    client = make_client(threshold=1)
+    outcomes.append(requests.exceptions.ProxyError('bad proxy'))
+    with pytest.raises(requests.exceptions.ProxyError):
+        client.get('http://a.com')
+    assert len(calls) == 1
+    assert client.breaker.state('a.com') == retry.CircuitBreaker.CLOSED
+
+
+def test_backoff_is_bounded():
+    policy = retry.RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+    for attempt in range(10):
+        assert 0 <= policy.backoff(attempt) <= min(4.0, 2 ** attempt)